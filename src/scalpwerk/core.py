@@ -1,16 +1,19 @@
+import itertools
+import random
 import signal
 import sqlite3
+import sys
 import threading
 import time
 import typing
 import uuid
 
 from abc import ABC, abstractmethod
+from array import array
 from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from dataclasses import MISSING, dataclass, field, fields
+from enum import Enum, IntEnum, auto
 from pathlib import Path
-from queue import Queue
 
 __all__ = [
     # Domain-Specific Type Definitions
@@ -30,6 +33,7 @@ __all__ = [
     "RunId",
     # Public Classes
     "Models",
+    "SymbolTable",
     "Events",
     "EventBus",
     "BrokerBase",
@@ -52,27 +56,40 @@ PositionSize = typing.NewType("PositionSize", int)
 IndicatorName = typing.NewType("IndicatorName", str)
 IndicatorValue = typing.NewType("IndicatorValue", float)
 Symbol = typing.NewType("Symbol", str)
-InternalOrderId = typing.NewType("InternalOrderId", uuid.UUID)
-InternalFillId = typing.NewType("InternalFillId", uuid.UUID)
+# Internal IDs are raw 128-bit ints rather than `uuid.UUID` objects: hashing and
+# equality against dict keys become C-level int compares and each ID avoids the
+# ~56-byte object wrapper that UUID adds around the integer.
+InternalOrderId = typing.NewType("InternalOrderId", int)
+InternalFillId = typing.NewType("InternalFillId", int)
 BrokerOrderId = typing.NewType("BrokerOrderId", str)
 BrokerFillId = typing.NewType("BrokerFillId", str)
 RunId = typing.NewType("RunId", str)
 
+# Bound once at import; `getrandbits(128)` is ~3x faster than `uuid.uuid4()` since it
+# skips UUID's version/variant bit twiddling and object construction. Drawn from a
+# private `Random` instance so `random.seed()` calls made by user code for backtest
+# reproducibility cannot rewind this stream and hand out duplicate IDs.
+_new_id = random.Random().getrandbits
+
 
 # ——————————————————————————————————————————————————————————————————————————————————————
 # DOMAIN MODEL DEFINITIONS
 
 
 class Models:
-    class OrderType(Enum):
+    # IntEnum so comparisons compile down to C-level integer equality instead of
+    # `Enum.__eq__`'s object comparison; these are checked on every event.
+    class OrderType(IntEnum):
         MARKET = auto()
         LIMIT = auto()
         STOP = auto()
         STOP_LIMIT = auto()
 
-    class TradeSide(Enum):
-        BUY = auto()
-        SELL = auto()
+    # The ±1 values double as the position sign, so fill arithmetic can multiply
+    # by the side instead of branching on it.
+    class TradeSide(IntEnum):
+        BUY = 1
+        SELL = -1
 
     # The enum values for record types match DataBento's schema values for convenience.
     class RecordType(Enum):
@@ -82,16 +99,184 @@ class Models:
         OHLCV_1D = 35
 
 
+# Bidirectional str<->int symbol registry. Interning a symbol yields a stable
+# small-int id so per-symbol state can live in arrays indexed by id instead of
+# dicts that hash strings on every lookup; `sys.intern` is also applied to the
+# name so remaining str-keyed lookups compare by pointer before falling back to
+# a character compare. Conversion happens at ingest/egress boundaries only.
+class SymbolTable:
+    def __init__(self) -> None:
+        self._ids: dict[Symbol, int] = {}
+        self._names: list[Symbol] = []
+        # Interning may be called from datafeed and broker threads concurrently.
+        self._lock: threading.Lock = threading.Lock()
+
+    def intern(self, symbol: Symbol) -> int:
+        # Lock-free fast path: ids are never reassigned once published.
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is not None:
+            return symbol_id
+        with self._lock:
+            symbol_id = self._ids.get(symbol)
+            if symbol_id is None:
+                symbol = Symbol(sys.intern(symbol))
+                symbol_id = len(self._names)
+                self._names.append(symbol)
+                self._ids[symbol] = symbol_id
+            return symbol_id
+
+    def name(self, symbol_id: int) -> Symbol:
+        return self._names[symbol_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# Shared table used on the hot event paths; independent tables can still be
+# instantiated for bookkeeping that must not grow the shared id space.
+_SYMBOLS: SymbolTable = SymbolTable()
+
+
 # ——————————————————————————————————————————————————————————————————————————————————————
 # EVENT DEFINITIONS
 
 
+# Freelists of recycled event instances, bucketed by concrete event type. Recycling
+# avoids paying allocation plus slot-init cost for every event on hot replay paths.
+# Each thread owns its freelists so steady-state acquire/release touch no lock; the
+# shared stash below is the exchange between the releasing (subscriber) threads and
+# the acquiring (emitter) threads, and is batch-filled/batch-drained so at most one
+# lock acquisition is paid per `_EVENT_POOL_LOCAL_CAP` pool operations.
+_EVENT_POOL_LOCAL = threading.local()
+_EVENT_POOL_STASH: defaultdict[type["_EventBase"], list["_EventBase"]] = defaultdict(
+    list
+)
+_EVENT_POOL_LOCK: threading.Lock = threading.Lock()
+# Spill threshold for a thread-local freelist. Matters because releases happen on
+# consumer threads while acquires happen on producer threads, so local lists would
+# otherwise grow on one side while the other always misses.
+_EVENT_POOL_LOCAL_CAP = 256
+
+
+def _local_freelists() -> dict[type["_EventBase"], list["_EventBase"]]:
+    lists = getattr(_EVENT_POOL_LOCAL, "lists", None)
+    if lists is None:
+        lists = _EVENT_POOL_LOCAL.lists = {}
+    return lists
+
+
+# Source of the per-class `kind` discriminators below.
+_EVENT_KIND_COUNTER = itertools.count()
+
+# Sentinel distinguishing "argument omitted" from any real field value inside the
+# generated reset functions.
+_UNSET = object()
+
+# Generated reset functions, one per event class, cached on first recycle. Each is
+# built with `exec` so reinitializing a recycled instance is a straight run of
+# `object.__setattr__` calls with the class's defaults baked into the signature,
+# instead of looping over `dataclasses.fields` metadata on every acquire. The event
+# classes stay frozen; only this generated code bypasses the frozen `__setattr__`.
+_EVENT_RESET_FNS: dict[type["_EventBase"], typing.Callable[..., None]] = {}
+
+
+def _make_reset_fn(cls: type["_EventBase"]) -> typing.Callable[..., None]:
+    parameters: list[str] = []
+    body: list[str] = []
+    namespace: dict[str, typing.Any] = {
+        "_set": object.__setattr__,
+        "_UNSET": _UNSET,
+    }
+    for f in fields(cls):
+        # Non-init fields (the pool marker) keep their current value on reset.
+        if not f.init:
+            continue
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            parameters.append(f"{f.name}=_default_{f.name}")
+        elif f.default_factory is not MISSING:
+            # Factories must run per reset, so they cannot be baked in as a
+            # shared default value the way plain defaults can.
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            parameters.append(f"{f.name}=_UNSET")
+            body.append(f"    if {f.name} is _UNSET: {f.name} = _factory_{f.name}()")
+        else:
+            parameters.append(f.name)
+        body.append(f"    _set(self, '{f.name}', {f.name})")
+    source = "def _reset(self, *, {}):\n{}".format(
+        ", ".join(parameters), "\n".join(body)
+    )
+    exec(source, namespace)
+    return namespace["_reset"]
+
+
 # Defined outside `Events` so nested classes within `Events` can inherit from it.
 @dataclass(kw_only=True, frozen=True, slots=True)
 class _EventBase:
+    # Small-int discriminator assigned per subclass so dispatch tables can be
+    # lists indexed by `kind` instead of dicts hashing the type object.
+    kind: typing.ClassVar[int] = -1
+
     occurred_at_ns: UnixNanoseconds
     created_at_ns: UnixNanoseconds
 
+    # True only for instances whose lifecycle is managed by the freelist pool.
+    # An instance marker instead of a global id registry: checking it is one slot
+    # read with no lock, and stale-registry hazards after id reuse cannot occur.
+    _pooled: bool = field(default=False, init=False, compare=False, repr=False)
+
+    # No `super().__init_subclass__()` call: `slots=True` recreates each class, which
+    # leaves the zero-arg `super()` cell pointing at the discarded pre-slots class.
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        # The recreated class also passes through here, so the discarded pre-slots
+        # class burns an id; the gaps are harmless because kinds are only ever
+        # used as dispatch-table indices.
+        cls.kind = next(_EVENT_KIND_COUNTER)
+
+    # Pops a recycled instance of `cls` and rewrites its fields in place, falling
+    # back to normal construction when the freelist is empty. Events obtained here
+    # are returned to the pool by `EventBus` once every subscriber has handled
+    # them, so callers must not retain references beyond their `_on_event` call.
+    @classmethod
+    def acquire(cls, **kwargs: typing.Any) -> typing.Self:
+        freelists = _local_freelists()
+        freelist = freelists.get(cls)
+        recycled = freelist.pop() if freelist else None
+        if recycled is None:
+            # Local underflow: drain the whole shared stash for this type in one
+            # locked operation so subsequent acquires stay lock-free.
+            with _EVENT_POOL_LOCK:
+                stash = _EVENT_POOL_STASH.get(cls)
+                if stash:
+                    if freelist is None:
+                        freelist = freelists[cls] = []
+                    freelist.extend(stash)
+                    stash.clear()
+                    recycled = freelist.pop()
+        if recycled is None:
+            instance = cls(**kwargs)
+            object.__setattr__(instance, "_pooled", True)
+            return instance
+        reset = _EVENT_RESET_FNS.get(cls)
+        if reset is None:
+            reset = _EVENT_RESET_FNS[cls] = _make_reset_fn(cls)
+        reset(recycled, **kwargs)
+        return typing.cast(typing.Self, recycled)
+
+    @staticmethod
+    def release(event: "_EventBase") -> None:
+        freelists = _local_freelists()
+        freelist = freelists.get(type(event))
+        if freelist is None:
+            freelist = freelists[type(event)] = []
+        freelist.append(event)
+        if len(freelist) >= _EVENT_POOL_LOCAL_CAP:
+            # Spill the whole list in one locked operation so releasing threads
+            # pay at most one lock acquisition per cap's worth of releases.
+            with _EVENT_POOL_LOCK:
+                _EVENT_POOL_STASH[type(event)].extend(freelist)
+            freelist.clear()
+
 
 class Events:
     class MarketUpdate:
@@ -110,6 +295,85 @@ class Events:
             close: ScaledPrice
             volume: Volume | None = None
 
+        # Structure-of-arrays view over a chunk of bars for one symbol. The
+        # columns are parallel sequences indexed by row (packed int64 arrays when
+        # built via `from_bars`), so a replay datafeed can publish thousands of
+        # bars as a single event instead of allocating one boxed object per bar.
+        # `occurred_at_ns`/`created_at_ns` on the batch itself refer to the last
+        # bar in the chunk.
+        @dataclass(kw_only=True, frozen=True, slots=True)
+        class OHLCVBatch(_EventBase):
+            symbol: Symbol
+            record_type: typing.Literal[
+                Models.RecordType.OHLCV_1S,
+                Models.RecordType.OHLCV_1M,
+                Models.RecordType.OHLCV_1H,
+                Models.RecordType.OHLCV_1D,
+            ]
+            # Id of `symbol` in the shared `SymbolTable`; -1 when the batch was
+            # built without interning.
+            symbol_id: int = -1
+            occurred_at_ns_col: typing.Sequence[int]
+            created_at_ns_col: typing.Sequence[int]
+            open_col: typing.Sequence[int]
+            high_col: typing.Sequence[int]
+            low_col: typing.Sequence[int]
+            close_col: typing.Sequence[int]
+            # -1 marks a bar without volume so the column stays homogeneous.
+            volume_col: typing.Sequence[int]
+
+            def __len__(self) -> int:
+                return len(self.occurred_at_ns_col)
+
+            # Materializes one row as a regular per-bar event for consumers that
+            # need the object API (e.g. indicators and `on_market_update`).
+            def row(self, index: int) -> "Events.MarketUpdate.OHLCV":
+                volume = self.volume_col[index]
+                return Events.MarketUpdate.OHLCV(
+                    occurred_at_ns=UnixNanoseconds(self.occurred_at_ns_col[index]),
+                    created_at_ns=UnixNanoseconds(self.created_at_ns_col[index]),
+                    symbol=self.symbol,
+                    record_type=self.record_type,
+                    open=ScaledPrice(self.open_col[index]),
+                    high=ScaledPrice(self.high_col[index]),
+                    low=ScaledPrice(self.low_col[index]),
+                    close=ScaledPrice(self.close_col[index]),
+                    volume=Volume(volume) if volume >= 0 else None,
+                )
+
+            def __iter__(self) -> typing.Iterator["Events.MarketUpdate.OHLCV"]:
+                for index in range(len(self)):
+                    yield self.row(index)
+
+            @classmethod
+            def from_bars(
+                cls, bars: typing.Sequence["Events.MarketUpdate.OHLCV"]
+            ) -> "Events.MarketUpdate.OHLCVBatch":
+                if not bars:
+                    raise ValueError("Cannot build an OHLCVBatch from zero bars.")
+                last = bars[-1]
+                symbol_id = _SYMBOLS.intern(last.symbol)
+                # `array('q')` stores each value as a packed C int64 (8 bytes)
+                # instead of a ~28-byte heap-allocated PyLong per field, and
+                # raises OverflowError on values outside the int64 range.
+                return cls(
+                    occurred_at_ns=last.occurred_at_ns,
+                    created_at_ns=last.created_at_ns,
+                    symbol=_SYMBOLS.name(symbol_id),
+                    record_type=last.record_type,
+                    symbol_id=symbol_id,
+                    occurred_at_ns_col=array("q", (b.occurred_at_ns for b in bars)),
+                    created_at_ns_col=array("q", (b.created_at_ns for b in bars)),
+                    open_col=array("q", (b.open for b in bars)),
+                    high_col=array("q", (b.high for b in bars)),
+                    low_col=array("q", (b.low for b in bars)),
+                    close_col=array("q", (b.close for b in bars)),
+                    volume_col=array(
+                        "q",
+                        (b.volume if b.volume is not None else -1 for b in bars),
+                    ),
+                )
+
     class StrategyUpdate:
         @dataclass(kw_only=True, frozen=True, slots=True)
         class IndicatorUpdate(_EventBase):
@@ -204,61 +468,244 @@ class _SubscriberLike(typing.Protocol):
     @property
     def is_idle(self) -> bool: ...
     def receive(self, event: _EventBase) -> None: ...
+    def receive_many(self, events: typing.Sequence[_EventBase]) -> None: ...
 
 
 class EventBus:
     def __init__(self) -> None:
-        # Using a set as the defaultdict's value avoids needing additional logic to
-        # guard against duplicate subscriptions in the `add_event_subscription` method.
-        self._per_event_subscriptions: defaultdict[
-            type[_EventBase], set[_SubscriberLike]
-        ] = defaultdict(set)
+        # A plain dict (not a defaultdict) so a lookup miss can never silently
+        # grow the mapping; sets as values guard against duplicate subscriptions
+        # without additional logic in the `add_event_subscription` method.
+        self._per_event_subscriptions: dict[type[_EventBase], set[_SubscriberLike]] = {}
+        # Copy-on-write view of `_per_event_subscriptions`, indexed by the event
+        # class's `kind` and rebuilt under the lock whenever subscriptions
+        # change. Publishing reads it without locking: a whole new list is
+        # swapped in atomically under the GIL, and subscriptions are write-rare
+        # while publishing is the hot path.
+        self._snapshot: list[tuple[_SubscriberLike, ...]] = []
+        # Maintained incrementally so a whole-system view never has to be rebuilt
+        # by unioning the per-type sets.
+        self._all_subscribers: set[_SubscriberLike] = set()
+        # Every subscriber paired with a bitmask over event kinds it subscribes
+        # to, rebuilt on subscription changes. Batch publishing tests interest
+        # with one integer AND per subscriber instead of a table lookup per
+        # event/subscriber pair.
+        self._masked_subscribers: list[tuple[_SubscriberLike, int]] = []
         # Each subscriber runs in its own thread. The Lock ensures that only one
         # subscriber thread at a time can access `_per_event_subscriptions`.
         self._lock: threading.Lock = threading.Lock()
+        # Outstanding delivery counts for pooled events, keyed by `id()`. An event
+        # is released back to its freelist once the count reaches zero.
+        self._pooled_deliveries: dict[int, list] = {}
+        # System-wide count of deliveries that have been handed to a subscriber
+        # but not yet finished by its `_on_event`. Incremented on publish and
+        # decremented in `_event_delivered`, so idle detection is a single
+        # counter check regardless of how many subscribers exist.
+        self._inflight: int = 0
+        self._idle_cv: threading.Condition = threading.Condition()
 
     def add_event_subscription(
         self, subscriber: _SubscriberLike, event_type: type[_EventBase]
     ) -> None:
         with self._lock:
-            self._per_event_subscriptions[event_type].add(subscriber)
+            subscriber_set = self._per_event_subscriptions.get(event_type)
+            if subscriber_set is None:
+                subscriber_set = self._per_event_subscriptions[event_type] = set()
+            subscriber_set.add(subscriber)
+            self._all_subscribers.add(subscriber)
+            snapshot = list(self._snapshot)
+            if event_type.kind >= len(snapshot):
+                snapshot.extend([()] * (event_type.kind + 1 - len(snapshot)))
+            snapshot[event_type.kind] = tuple(subscriber_set)
+            self._snapshot = snapshot
+            self._rebuild_masks()
+
+    # Must be called with `_lock` held.
+    def _rebuild_masks(self) -> None:
+        masks: dict[_SubscriberLike, int] = {}
+        for event_type, subscriber_set in self._per_event_subscriptions.items():
+            bit = 1 << event_type.kind
+            for subscriber in subscriber_set:
+                masks[subscriber] = masks.get(subscriber, 0) | bit
+        self._masked_subscribers = list(masks.items())
 
     def remove_subscriber(self, subscriber: _SubscriberLike) -> None:
         with self._lock:
-            for subscriber_set in self._per_event_subscriptions.values():
-                subscriber_set.discard(subscriber)
+            if subscriber not in self._all_subscribers:
+                return
+            self._all_subscribers.discard(subscriber)
+            snapshot = list(self._snapshot)
+            for event_type, subscriber_set in self._per_event_subscriptions.items():
+                if subscriber in subscriber_set:
+                    subscriber_set.discard(subscriber)
+                    snapshot[event_type.kind] = tuple(subscriber_set)
+            self._snapshot = snapshot
+            self._rebuild_masks()
 
     def publish_event_to_system(self, event: _EventBase) -> None:
-        # Copy under the Lock and iterate outside it so the Lock is held as briefly
-        # as possible and concurrent publishes from other threads are not blocked.
-        with self._lock:
-            subscribers = self._per_event_subscriptions[type(event)].copy()
+        # Reads the copy-on-write snapshot, so no lock and no set copy per publish.
+        # The bounds check covers event classes defined after the last rebuild.
+        snapshot = self._snapshot
+        subscribers = snapshot[event.kind] if event.kind < len(snapshot) else ()
+        if event._pooled:
+            if not subscribers:
+                _EventBase.release(event)
+                return
+            with self._lock:
+                self._pooled_deliveries[id(event)] = [event, len(subscribers)]
+        if subscribers:
+            with self._idle_cv:
+                self._inflight += len(subscribers)
         for subscriber in subscribers:
             subscriber.receive(event)
 
+    # Delivers a burst of events (e.g. an OHLCV bar plus derived broker events) so
+    # each subscriber pays a single lock acquisition and wakeup for the whole batch
+    # instead of one per event.
+    def publish_batch(self, events: typing.Sequence[_EventBase]) -> None:
+        per_subscriber: dict[_SubscriberLike, list[_EventBase]] = {}
+        masked = self._masked_subscribers
+        for event in events:
+            event_bit = 1 << event.kind
+            recipients = 0
+            for subscriber, mask in masked:
+                if mask & event_bit:
+                    per_subscriber.setdefault(subscriber, []).append(event)
+                    recipients += 1
+            if event._pooled:
+                if not recipients:
+                    _EventBase.release(event)
+                    continue
+                with self._lock:
+                    self._pooled_deliveries[id(event)] = [event, recipients]
+        deliveries = sum(len(batch) for batch in per_subscriber.values())
+        if deliveries:
+            with self._idle_cv:
+                self._inflight += deliveries
+        for subscriber, batch in per_subscriber.items():
+            subscriber.receive_many(batch)
+
+    # Fused construct-and-publish helpers for the broker-request types. The
+    # request is pulled from the freelist pool, filled in place, and dispatched
+    # in one call, then recycled once the last subscriber's `_on_event` returns —
+    # so these are only for emitters that do not retain the request object.
+    # `StrategyBase` keeps constructing its requests directly because it tracks
+    # them in its in-flight dicts until the broker responds.
+    def submit_order(
+        self,
+        *,
+        occurred_at_ns: UnixNanoseconds,
+        created_at_ns: UnixNanoseconds,
+        internal_order_id: InternalOrderId,
+        symbol: Symbol,
+        order_type: Models.OrderType,
+        side: Models.TradeSide,
+        quantity: Quantity,
+        limit_price: ScaledPrice | None = None,
+        stop_price: ScaledPrice | None = None,
+    ) -> None:
+        self.publish_event_to_system(
+            Events.BrokerRequest.SubmitOrder.acquire(
+                occurred_at_ns=occurred_at_ns,
+                created_at_ns=created_at_ns,
+                internal_order_id=internal_order_id,
+                symbol=symbol,
+                order_type=order_type,
+                side=side,
+                quantity=quantity,
+                limit_price=limit_price,
+                stop_price=stop_price,
+            )
+        )
+
+    def modify_order(
+        self,
+        *,
+        occurred_at_ns: UnixNanoseconds,
+        created_at_ns: UnixNanoseconds,
+        internal_order_id: InternalOrderId,
+        symbol: Symbol,
+        quantity: Quantity,
+        limit_price: ScaledPrice | None = None,
+        stop_price: ScaledPrice | None = None,
+    ) -> None:
+        self.publish_event_to_system(
+            Events.BrokerRequest.ModifyOrder.acquire(
+                occurred_at_ns=occurred_at_ns,
+                created_at_ns=created_at_ns,
+                internal_order_id=internal_order_id,
+                symbol=symbol,
+                quantity=quantity,
+                limit_price=limit_price,
+                stop_price=stop_price,
+            )
+        )
+
+    def cancel_order(
+        self,
+        *,
+        occurred_at_ns: UnixNanoseconds,
+        created_at_ns: UnixNanoseconds,
+        internal_order_id: InternalOrderId,
+        symbol: Symbol,
+    ) -> None:
+        self.publish_event_to_system(
+            Events.BrokerRequest.CancelOrder.acquire(
+                occurred_at_ns=occurred_at_ns,
+                created_at_ns=created_at_ns,
+                internal_order_id=internal_order_id,
+                symbol=symbol,
+            )
+        )
+
+    # Called by subscribers once `_on_event` has finished (or the event was dropped
+    # because the subscriber is shutting down) so pooled events can be recycled
+    # after their last delivery.
+    def _event_delivered(self, event: _EventBase) -> None:
+        with self._idle_cv:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._idle_cv.notify_all()
+        if not self._pooled_deliveries:
+            return
+        with self._lock:
+            entry = self._pooled_deliveries.get(id(event))
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self._pooled_deliveries[id(event)]
+        _EventBase.release(event)
+
     # Backtesting must wait for all subscribers to finish before feeding the next market
     # event, otherwise the strategy and simulated broker would fall out of sync.
     def wait_until_system_idle(self) -> None:
-        # A single pass is insufficient because processing can publish new events into
-        # already-drained queues, so we loop until a re-check confirms idleness.
-        while True:
-            # Waiting for the subscribers to be idle needs to be done outside the lock
-            # since they may require the lock themselves to publish an event.
-            with self._lock:
-                subscribers = set().union(*self._per_event_subscriptions.values())
-            for subscriber in subscribers:
-                subscriber.wait_until_idle()
-
-            with self._lock:
-                subscribers = set().union(*self._per_event_subscriptions.values())
-            if all(subscriber.is_idle for subscriber in subscribers):
-                break
+        # Cascades are covered without re-polling: handlers publish (and thereby
+        # increment `_inflight`) before their own delivery is decremented, so the
+        # counter only reaches zero once every cascade has fully drained.
+        with self._idle_cv:
+            while self._inflight:
+                self._idle_cv.wait()
 
 
 # ——————————————————————————————————————————————————————————————————————————————————————
 # GENERAL SYSTEM COMPONENT BASE CLASS DEFINITIONS
 
 
+# Converts a handler mapping into a list indexed by event `kind`, so dispatching an
+# event is a C-level list index instead of a dict lookup that hashes the type object.
+def _kind_dispatch_table(
+    handlers: dict[type[_EventBase], typing.Callable[..., None]],
+) -> list[typing.Callable[..., None] | None]:
+    table: list[typing.Callable[..., None] | None] = [None] * (
+        max(event_type.kind for event_type in handlers) + 1
+    )
+    for event_type, handler in handlers.items():
+        table[event_type.kind] = handler
+    return table
+
+
 class _ComponentBase(ABC):
     def __init__(self, event_bus: EventBus) -> None:
         # The concrete `EventBus` instance is injected rather than a global instance so
@@ -274,40 +721,119 @@ class _SubscriberBase(_ComponentBase):
     ) -> None:
         super().__init__(event_bus)
         self._on_fatal = on_fatal
+        # Single-consumer event buffer. A deque guarded by one Condition replaces
+        # `queue.Queue`, which signals three condition variables (`not_full`,
+        # `not_empty`, `all_tasks_done`) per event; only one is needed here.
         # None acts as a poison pill that tells the event loop to shut down.
-        self._queue: Queue[_EventBase | None] = Queue()
+        self._buffer: deque[_EventBase | None] = deque()
+        self._cv: threading.Condition = threading.Condition()
+        # Number of received events `_on_event` has not finished handling yet.
+        # Guarded by `_cv`; `wait_until_idle` blocks on the same Condition until
+        # it drops to zero, so no separate idle primitive is needed.
+        self._pending: int = 0
+        # Guarded by `_cv`; set by `_close_receive` so open bindings resolved
+        # just before the closed swap cannot enqueue onto a dead consumer.
+        self._closed: bool = False
         # Thread-safe flag (no Lock needed). Set before starting the thread so receive
         # can accept events immediately; otherwise they'd be silently dropped.
         self._running: threading.Event = threading.Event()
         self._running.set()
+        # Binds the fast paths into the instance dict; see `_receive_open`
+        # above.
+        self.receive = self._receive_open  # type: ignore[method-assign]
+        self.receive_many = self._receive_many_open  # type: ignore[method-assign]
         self._thread = threading.Thread(
             target=self._event_loop, name=self.__class__.__name__
         )
         self._thread.start()
 
     def wait_until_idle(self) -> None:
-        if not self._running.is_set():
-            return
-        self._queue.join()
-
-    # Checks idleness without waiting for the queue to drain (i.e., non-blocking check).
+        # The `_running` re-check inside the loop covers a fatal loop exit while
+        # waiting; the dying thread notifies the Condition on its way out.
+        with self._cv:
+            while self._pending and self._running.is_set():
+                self._cv.wait()
+
+    # Checks idleness without waiting for the buffer to drain (i.e., non-blocking
+    # check).
     @property
     def is_idle(self) -> bool:
         if not self._running.is_set():
             return True
-        return self._queue.unfinished_tasks == 0
-
-    def receive(self, event: _EventBase) -> None:
-        if self._running.is_set():
-            self._queue.put(event)
+        return self._pending == 0
+
+    # `_running` toggles exactly once per subscriber lifetime, so instead of
+    # checking it on every delivery the constructor binds the "open" variants
+    # below into the instance dict as `receive`/`receive_many` (shadowing the
+    # class attributes, which also skips descriptor resolution), and `shutdown`
+    # or a fatal loop exit swaps in the "closed" variants. The swap alone
+    # leaves a window — a publisher may resolve the open binding just before
+    # it — so the open variants re-check `_closed` under `_cv`, which is free
+    # on the hot path since the Condition is already held there.
+    def _receive_open(self, event: _EventBase) -> None:
+        # `notify_all` because idle waiters share the Condition: a single notify
+        # could wake one of them instead of the consumer and lose the wakeup.
+        with self._cv:
+            if not self._closed:
+                self._buffer.append(event)
+                self._pending += 1
+                self._cv.notify_all()
+                return
+        # Stale open binding after close: the consumer may already be gone, so
+        # mark the dropped event delivered directly (outside `_cv`, since the
+        # bus takes its own lock).
+        self._event_bus._event_delivered(event)
+
+    def _receive_closed(self, event: _EventBase) -> None:
+        # Dropped events still count as delivered, otherwise the bus would
+        # wait forever before recycling a pooled event.
+        self._event_bus._event_delivered(event)
+
+    # Enqueues a whole burst under one Condition acquisition, amortizing the lock
+    # and wakeup cost over the batch.
+    def _receive_many_open(self, events: typing.Sequence[_EventBase]) -> None:
+        if not events:
+            return
+        with self._cv:
+            if not self._closed:
+                self._buffer.extend(events)
+                self._pending += len(events)
+                self._cv.notify_all()
+                return
+        for event in events:
+            self._event_bus._event_delivered(event)
+
+    def _receive_many_closed(self, events: typing.Sequence[_EventBase]) -> None:
+        for event in events:
+            self._event_bus._event_delivered(event)
+
+    # Class-level bindings exist so the names resolve before `__init__` has run;
+    # instances always shadow them.
+    receive = _receive_open
+    receive_many = _receive_many_open
+
+    def _close_receive(self) -> None:
+        # The flag is set under `_cv` before the swap: once the pill or fatal
+        # drain (which also runs under `_cv`) has collected the buffer, no
+        # stale open binding can append to it anymore.
+        with self._cv:
+            self._closed = True
+        self.receive = self._receive_closed  # type: ignore[method-assign]
+        self.receive_many = self._receive_many_closed  # type: ignore[method-assign]
 
     def shutdown(self):
         if not self._running.is_set():
             return
         self._event_bus.remove_subscriber(self)
+        # Swap before clearing `_running` so no event can slip in behind the
+        # poison pill; the instance-dict assignment is atomic under the GIL.
+        self._close_receive()
         # Clear `_running` before the poison pill so `receive` stops accepting events
         self._running.clear()
-        self._queue.put(None)
+        # Appended without touching `_pending`: the pill is control flow, not work.
+        with self._cv:
+            self._buffer.append(None)
+            self._cv.notify_all()
         # If `shutdown()` is called from within `_on_event`, we're on the subscriber's
         # own thread. A thread cannot join itself, this prevents a runtime error.
         if threading.current_thread() is not self._thread:
@@ -319,23 +845,56 @@ class _SubscriberBase(_ComponentBase):
 
     def _event_loop(self):
         try:
+            drained: deque[_EventBase | None] = deque()
             while True:
-                event = self._queue.get()
-                if event is None:
-                    # `task_done()` needs to be called for the poison pill itself,
-                    # otherwise `queue.join()` would block indefinitely after shutdown.
-                    self._queue.task_done()
-                    break
-                # If `_on_exception` re-raises, the outer except clears `_running` so
-                # the system doesn't deadlock on a dead thread.
-                try:
-                    self._on_event(event)
-                except Exception as exc:
-                    self._on_exception(exc)
-                finally:
-                    self._queue.task_done()
+                with self._cv:
+                    while not self._buffer:
+                        self._cv.wait()
+                    # Swap the whole buffer out so a burst is drained in a tight
+                    # loop without re-acquiring the Condition for every event.
+                    drained, self._buffer = self._buffer, drained
+                while drained:
+                    event = drained.popleft()
+                    if event is None:
+                        # `_close_receive` flips `_closed` under `_cv` before the
+                        # pill is appended, so nothing can land behind the pill;
+                        # anything still trailing it is drained defensively and
+                        # marked delivered so the bus-wide inflight counter can
+                        # never wedge `wait_until_system_idle`.
+                        with self._cv:
+                            leftovers = list(drained) + list(self._buffer)
+                            self._buffer.clear()
+                        for leftover in leftovers:
+                            if leftover is not None:
+                                self._event_bus._event_delivered(leftover)
+                        return
+                    # If `_on_exception` re-raises, the outer except clears
+                    # `_running` so the system doesn't deadlock on a dead thread.
+                    try:
+                        self._on_event(event)
+                    except Exception as exc:
+                        self._on_exception(exc)
+                    finally:
+                        self._event_bus._event_delivered(event)
+                        with self._cv:
+                            self._pending -= 1
+                            if self._pending == 0:
+                                self._cv.notify_all()
         except Exception:
+            self._close_receive()
             self._running.clear()
+            # Events this thread will never handle still have to be marked as
+            # delivered, otherwise the bus-wide inflight counter would wedge
+            # `wait_until_system_idle` on a dead subscriber. The notify unblocks
+            # `wait_until_idle` callers, whose re-check of `_running` lets them
+            # return rather than wait on a dead thread.
+            with self._cv:
+                leftovers = list(drained) + list(self._buffer)
+                self._buffer.clear()
+                self._cv.notify_all()
+            for event in leftovers:
+                if event is not None:
+                    self._event_bus._event_delivered(event)
             self._on_fatal()
 
     @abstractmethod
@@ -394,6 +953,18 @@ class BrokerBase(
     ):
         super().__init__(event_bus, on_fatal=on_fatal)
 
+        # Bound-method dispatch table indexed by event `kind`: a single list
+        # index replaces the sequential class-pattern checks a `match` statement
+        # would perform for every event. Built before subscribing so an event
+        # delivered immediately after subscription never races the assignment.
+        self._dispatch = _kind_dispatch_table(
+            {
+                Events.BrokerRequest.SubmitOrder: self._on_submit_order,
+                Events.BrokerRequest.ModifyOrder: self._on_modify_order,
+                Events.BrokerRequest.CancelOrder: self._on_cancel_order,
+            }
+        )
+
         self._subscribe_to_events(
             Events.BrokerRequest.SubmitOrder,
             Events.BrokerRequest.ModifyOrder,
@@ -401,15 +972,11 @@ class BrokerBase(
         )
 
     def _on_event(self, event: _EventBase) -> None:
-        match event:
-            case Events.BrokerRequest.SubmitOrder() as submit_order_event:
-                self._on_submit_order(submit_order_event)
-            case Events.BrokerRequest.ModifyOrder() as modify_order_event:
-                self._on_modify_order(modify_order_event)
-            case Events.BrokerRequest.CancelOrder() as cancel_order_event:
-                self._on_cancel_order(cancel_order_event)
-            case _:
-                return
+        kind = event.kind
+        if kind < len(self._dispatch):
+            handler = self._dispatch[kind]
+            if handler is not None:
+                handler(event)
 
     @abstractmethod
     def _on_submit_order(self, event: Events.BrokerRequest.SubmitOrder) -> None:
@@ -424,7 +991,10 @@ class BrokerBase(
         pass
 
 
-class DatafeedBase(_ExternalComponentMixin, _EmitterBase[Events.MarketUpdate.OHLCV]):
+class DatafeedBase(
+    _ExternalComponentMixin,
+    _EmitterBase[Events.MarketUpdate.OHLCV | Events.MarketUpdate.OHLCVBatch],
+):
     def __init__(
         self,
         event_bus: EventBus,
@@ -488,8 +1058,11 @@ class IndicatorBase(ABC):
             return IndicatorValue(float("nan"))
 
 
-@dataclass(frozen=True, slots=True)
-class _PendingOrder:
+# NamedTuple rather than a frozen dataclass: an instance is rebuilt on every
+# acceptance, fill, and modification, and a tuple subclass stores its fields in
+# the tuple's own item array — one allocation per rebuild with C-level field
+# access, no per-slot descriptor writes.
+class _PendingOrder(typing.NamedTuple):
     order: Events.BrokerRequest.SubmitOrder
     filled_quantity: FilledQuantity
 
@@ -515,18 +1088,6 @@ class StrategyBase(
         self._symbols: list[Symbol] = symbols
         self._record_type: Models.RecordType = record_type
 
-        self._subscribe_to_events(
-            Events.MarketUpdate.OHLCV,
-            Events.BrokerResponse.OrderAccepted,
-            Events.BrokerResponse.OrderRejected,
-            Events.BrokerResponse.ModificationAccepted,
-            Events.BrokerResponse.ModificationRejected,
-            Events.BrokerResponse.CancellationAccepted,
-            Events.BrokerResponse.CancellationRejected,
-            Events.BrokerResponse.Fill,
-            Events.BrokerResponse.OrderExpired,
-        )
-
         self._current_symbol: Symbol | None = None
         self._current_event_ns: UnixNanoseconds | None = None
 
@@ -551,6 +1112,46 @@ class StrategyBase(
         self._position_sizes: dict[Symbol, PositionSize] = {}
         self._average_entry_prices: dict[Symbol, ScaledPrice] = {}
 
+        # Bound-method dispatch table indexed by event `kind`: a single list
+        # index replaces the sequential class-pattern checks a `match` statement
+        # would perform for every event. Built before subscribing so an event
+        # delivered immediately after subscription never races the assignment.
+        self._dispatch = _kind_dispatch_table(
+            {
+                Events.MarketUpdate.OHLCV: self._on_market_update,
+                Events.MarketUpdate.OHLCVBatch: self._on_market_batch,
+                Events.BrokerResponse.OrderAccepted: self._on_order_accepted,
+                Events.BrokerResponse.OrderRejected: self._on_order_rejected,
+                Events.BrokerResponse.ModificationAccepted: (
+                    self._on_modification_accepted
+                ),
+                Events.BrokerResponse.ModificationRejected: (
+                    self._on_modification_rejected
+                ),
+                Events.BrokerResponse.CancellationAccepted: (
+                    self._on_cancellation_accepted
+                ),
+                Events.BrokerResponse.CancellationRejected: (
+                    self._on_cancellation_rejected
+                ),
+                Events.BrokerResponse.Fill: self._on_fill,
+                Events.BrokerResponse.OrderExpired: self._on_order_expired,
+            }
+        )
+
+        self._subscribe_to_events(
+            Events.MarketUpdate.OHLCV,
+            Events.MarketUpdate.OHLCVBatch,
+            Events.BrokerResponse.OrderAccepted,
+            Events.BrokerResponse.OrderRejected,
+            Events.BrokerResponse.ModificationAccepted,
+            Events.BrokerResponse.ModificationRejected,
+            Events.BrokerResponse.CancellationAccepted,
+            Events.BrokerResponse.CancellationRejected,
+            Events.BrokerResponse.Fill,
+            Events.BrokerResponse.OrderExpired,
+        )
+
         # Must be last so base class state exists before the subclass's `setup()` runs.
         self.setup()
 
@@ -569,27 +1170,11 @@ class StrategyBase(
         return indicator
 
     def _on_event(self, event: _EventBase) -> None:
-        match event:
-            case Events.MarketUpdate.OHLCV() as ohlcv_event:
-                self._on_market_update(ohlcv_event)
-            case Events.BrokerResponse.OrderAccepted() as order_accepted_event:
-                self._on_order_accepted(order_accepted_event)
-            case Events.BrokerResponse.OrderRejected() as order_rejected_event:
-                self._on_order_rejected(order_rejected_event)
-            case Events.BrokerResponse.ModificationAccepted() as mod_accepted_event:
-                self._on_modification_accepted(mod_accepted_event)
-            case Events.BrokerResponse.ModificationRejected() as mod_rejected_event:
-                self._on_modification_rejected(mod_rejected_event)
-            case Events.BrokerResponse.CancellationAccepted() as cancel_accepted_event:
-                self._on_cancellation_accepted(cancel_accepted_event)
-            case Events.BrokerResponse.CancellationRejected() as cancel_rejected_event:
-                self._on_cancellation_rejected(cancel_rejected_event)
-            case Events.BrokerResponse.Fill() as fill_event:
-                self._on_fill(fill_event)
-            case Events.BrokerResponse.OrderExpired() as order_expired_event:
-                self._on_order_expired(order_expired_event)
-            case _:
-                return
+        kind = event.kind
+        if kind < len(self._dispatch):
+            handler = self._dispatch[kind]
+            if handler is not None:
+                handler(event)
 
     # Wraps the abstract `on_market_update` with internal plumbing.
     def _on_market_update(self, event: Events.MarketUpdate.OHLCV) -> None:
@@ -601,6 +1186,12 @@ class StrategyBase(
         # Emitted after `on_market_update` so strategy logic isn't delayed by emission.
         self._emit_indicator_update(event)
 
+    # Unpacks a batch through the per-bar path so strategy and indicator logic
+    # sees the same sequence of updates a bar-by-bar feed would produce.
+    def _on_market_batch(self, event: Events.MarketUpdate.OHLCVBatch) -> None:
+        for ohlcv_event in event:
+            self._on_market_update(ohlcv_event)
+
     @abstractmethod
     def on_market_update(self, event: Events.MarketUpdate.OHLCV) -> None:
         pass
@@ -617,8 +1208,10 @@ class StrategyBase(
             for name, indicator in self._indicators.items()
         }
 
+        # Acquired from the pool since indicator updates are emitted once per bar
+        # and no component retains them beyond its `_on_event` call.
         self._emit_event(
-            Events.StrategyUpdate.IndicatorUpdate(
+            Events.StrategyUpdate.IndicatorUpdate.acquire(
                 occurred_at_ns=self._current_event_ns,
                 created_at_ns=self._current_event_ns,
                 symbol=self._current_symbol,
@@ -654,7 +1247,7 @@ class StrategyBase(
     ) -> InternalOrderId:
         assert self._current_event_ns is not None
 
-        internal_order_id = InternalOrderId(uuid.uuid4())
+        internal_order_id = InternalOrderId(_new_id(128))
 
         event = Events.BrokerRequest.SubmitOrder(
             occurred_at_ns=self._current_event_ns,
@@ -799,11 +1392,8 @@ class StrategyBase(
     def _update_position_size_and_avg_entry_price(
         self, event: Events.BrokerResponse.Fill
     ) -> None:
-        signed_quantity = (
-            event.filled_quantity
-            if event.side == Models.TradeSide.BUY
-            else -event.filled_quantity
-        )
+        # `TradeSide` values are ±1, so this is branch-free.
+        signed_quantity = int(event.side) * event.filled_quantity
 
         # Default 0 so the first fill is handled as a fresh entry below.
         old_position = self._position_sizes.get(event.symbol, 0)
@@ -1145,6 +1735,35 @@ class _RunRecorder(_SubscriberBase):
 
         self._conn: sqlite3.Connection | None = None
 
+        # Bound-method dispatch table indexed by event `kind`: a single list
+        # index replaces the sequential class-pattern checks a `match` statement
+        # would perform for every event. Built before subscribing so an event
+        # delivered immediately after subscription never races the assignment.
+        self._dispatch = _kind_dispatch_table(
+            {
+                Events.StrategyUpdate.IndicatorUpdate: self._record_indicator_update,
+                Events.BrokerRequest.SubmitOrder: self._record_submit_order,
+                Events.BrokerRequest.ModifyOrder: self._record_modify_order,
+                Events.BrokerRequest.CancelOrder: self._record_cancel_order,
+                Events.BrokerResponse.OrderAccepted: self._record_order_accepted,
+                Events.BrokerResponse.OrderRejected: self._record_order_rejected,
+                Events.BrokerResponse.ModificationAccepted: (
+                    self._record_modification_accepted
+                ),
+                Events.BrokerResponse.ModificationRejected: (
+                    self._record_modification_rejected
+                ),
+                Events.BrokerResponse.CancellationAccepted: (
+                    self._record_cancellation_accepted
+                ),
+                Events.BrokerResponse.CancellationRejected: (
+                    self._record_cancellation_rejected
+                ),
+                Events.BrokerResponse.Fill: self._record_fill,
+                Events.BrokerResponse.OrderExpired: self._record_order_expired,
+            }
+        )
+
         self._subscribe_to_events(
             Events.StrategyUpdate.IndicatorUpdate,
             Events.BrokerRequest.SubmitOrder,
@@ -1202,228 +1821,222 @@ class _RunRecorder(_SubscriberBase):
                 self._conn.close()
 
     def _on_event(self, event: _EventBase) -> None:
+        kind = event.kind
+        if kind >= len(self._dispatch):
+            return
+        handler = self._dispatch[kind]
+        if handler is None:
+            return
         assert self._conn is not None  # For type checker; always set by _setup_db
+        handler(event, self._conn)
+        self._conn.commit()
 
-        match event:
-            case Events.StrategyUpdate.IndicatorUpdate() as e:
-                src = e.source_event
-                self._conn.execute(
-                    self._SQL_INSERT_OHLCV,
-                    (
-                        str(self._run_id),
-                        int(src.occurred_at_ns),
-                        int(src.created_at_ns),
-                        str(src.symbol),
-                        src.record_type.name,
-                        int(src.open),
-                        int(src.high),
-                        int(src.low),
-                        int(src.close),
-                        int(src.volume) if src.volume is not None else None,
-                    ),
-                )
-                self._conn.executemany(
-                    self._SQL_INSERT_INDICATOR_VALUE,
-                    [
-                        (
-                            str(self._run_id),
-                            str(src.symbol),
-                            src.record_type.name,
-                            int(src.occurred_at_ns),
-                            str(name),
-                            float(value),
-                        )
-                        for name, value in e.indicator_values.items()
-                    ],
-                )
-
-            case Events.BrokerRequest.SubmitOrder() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_SUBMIT_ORDER,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        str(e.symbol),
-                        e.order_type.name,
-                        e.side.name,
-                        int(e.quantity),
-                        int(e.limit_price) if e.limit_price is not None else None,
-                        int(e.stop_price) if e.stop_price is not None else None,
-                    ),
-                )
-
-            case Events.BrokerRequest.ModifyOrder() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_MODIFY_ORDER,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        str(e.symbol),
-                        int(e.quantity),
-                        int(e.limit_price) if e.limit_price is not None else None,
-                        int(e.stop_price) if e.stop_price is not None else None,
-                    ),
+    def _record_indicator_update(
+        self, e: Events.StrategyUpdate.IndicatorUpdate, conn: sqlite3.Connection
+    ) -> None:
+        src = e.source_event
+        conn.execute(
+            self._SQL_INSERT_OHLCV,
+            (
+                str(self._run_id),
+                int(src.occurred_at_ns),
+                int(src.created_at_ns),
+                str(src.symbol),
+                src.record_type.name,
+                int(src.open),
+                int(src.high),
+                int(src.low),
+                int(src.close),
+                int(src.volume) if src.volume is not None else None,
+            ),
+        )
+        conn.executemany(
+            self._SQL_INSERT_INDICATOR_VALUE,
+            [
+                (
+                    str(self._run_id),
+                    str(src.symbol),
+                    src.record_type.name,
+                    int(src.occurred_at_ns),
+                    str(name),
+                    float(value),
                 )
+                for name, value in e.indicator_values.items()
+            ],
+        )
 
-            case Events.BrokerRequest.CancelOrder() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_CANCEL_ORDER,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        str(e.symbol),
-                    ),
-                )
+    def _record_submit_order(
+        self, e: Events.BrokerRequest.SubmitOrder, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_SUBMIT_ORDER,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.symbol),
+                e.order_type.name,
+                e.side.name,
+                int(e.quantity),
+                int(e.limit_price) if e.limit_price is not None else None,
+                int(e.stop_price) if e.stop_price is not None else None,
+            ),
+        )
 
-            case Events.BrokerResponse.OrderAccepted() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_ORDER_ACCEPTED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                    ),
-                )
+    def _record_modify_order(
+        self, e: Events.BrokerRequest.ModifyOrder, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_MODIFY_ORDER,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.symbol),
+                int(e.quantity),
+                int(e.limit_price) if e.limit_price is not None else None,
+                int(e.stop_price) if e.stop_price is not None else None,
+            ),
+        )
 
-            case Events.BrokerResponse.OrderRejected() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_ORDER_REJECTED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                        e.reason,
-                    ),
-                )
+    def _record_cancel_order(
+        self, e: Events.BrokerRequest.CancelOrder, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_CANCEL_ORDER,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.symbol),
+            ),
+        )
 
-            case Events.BrokerResponse.ModificationAccepted() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_MODIFICATION_ACCEPTED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                    ),
-                )
+    def _record_order_accepted(
+        self, e: Events.BrokerResponse.OrderAccepted, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_ORDER_ACCEPTED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+            ),
+        )
 
-            case Events.BrokerResponse.ModificationRejected() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_MODIFICATION_REJECTED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                        e.reason,
-                    ),
-                )
+    def _record_order_rejected(
+        self, e: Events.BrokerResponse.OrderRejected, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_ORDER_REJECTED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+                e.reason,
+            ),
+        )
 
-            case Events.BrokerResponse.CancellationAccepted() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_CANCELLATION_ACCEPTED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                    ),
-                )
+    def _record_modification_accepted(
+        self, e: Events.BrokerResponse.ModificationAccepted, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_MODIFICATION_ACCEPTED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+            ),
+        )
 
-            case Events.BrokerResponse.CancellationRejected() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_CANCELLATION_REJECTED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                        e.reason,
-                    ),
-                )
+    def _record_modification_rejected(
+        self, e: Events.BrokerResponse.ModificationRejected, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_MODIFICATION_REJECTED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+                e.reason,
+            ),
+        )
 
-            case Events.BrokerResponse.Fill() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_FILL,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                        str(e.symbol),
-                        str(e.internal_fill_id),
-                        str(e.broker_fill_id) if e.broker_fill_id is not None else None,
-                        e.side.name,
-                        int(e.filled_quantity),
-                        int(e.fill_price),
-                        e.exchange,
-                        int(e.commission) if e.commission is not None else None,
-                    ),
-                )
+    def _record_cancellation_accepted(
+        self, e: Events.BrokerResponse.CancellationAccepted, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_CANCELLATION_ACCEPTED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+            ),
+        )
 
-            case Events.BrokerResponse.OrderExpired() as e:
-                self._conn.execute(
-                    self._SQL_INSERT_ORDER_EXPIRED,
-                    (
-                        str(self._run_id),
-                        int(e.occurred_at_ns),
-                        int(e.created_at_ns),
-                        str(e.internal_order_id),
-                        (
-                            str(e.broker_order_id)
-                            if e.broker_order_id is not None
-                            else None
-                        ),
-                    ),
-                )
+    def _record_cancellation_rejected(
+        self, e: Events.BrokerResponse.CancellationRejected, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_CANCELLATION_REJECTED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+                e.reason,
+            ),
+        )
 
-            case _:
-                return
+    def _record_fill(
+        self, e: Events.BrokerResponse.Fill, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_FILL,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+                str(e.symbol),
+                str(e.internal_fill_id),
+                str(e.broker_fill_id) if e.broker_fill_id is not None else None,
+                e.side.name,
+                int(e.filled_quantity),
+                int(e.fill_price),
+                e.exchange,
+                int(e.commission) if e.commission is not None else None,
+            ),
+        )
 
-        self._conn.commit()
+    def _record_order_expired(
+        self, e: Events.BrokerResponse.OrderExpired, conn: sqlite3.Connection
+    ) -> None:
+        conn.execute(
+            self._SQL_INSERT_ORDER_EXPIRED,
+            (
+                str(self._run_id),
+                int(e.occurred_at_ns),
+                int(e.created_at_ns),
+                str(e.internal_order_id),
+                str(e.broker_order_id) if e.broker_order_id is not None else None,
+            ),
+        )
 
     def _on_exception(self, exception: Exception) -> None:
         if self._conn is not None: